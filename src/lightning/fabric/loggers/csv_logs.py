@@ -22,6 +22,7 @@ from torch import Tensor
 from typing_extensions import override
 
 from lightning.fabric.loggers.logger import Logger, rank_zero_experiment
+from lightning.fabric.utilities.apply_func import convert_tensors_to_scalars
 from lightning.fabric.utilities.cloud_io import _is_dir, get_filesystem
 from lightning.fabric.utilities.logger import _add_prefix
 from lightning.fabric.utilities.rank_zero import rank_zero_only, rank_zero_warn
@@ -212,16 +213,10 @@ class _ExperimentWriter:
 
     def log_metrics(self, metrics_dict: dict[str, float], step: Optional[int] = None) -> None:
         """Record metrics."""
-
-        def _handle_value(value: Union[Tensor, Any]) -> Any:
-            if isinstance(value, Tensor):
-                return value.item()
-            return value
-
         if step is None:
             step = len(self.metrics)
 
-        metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
+        metrics = convert_tensors_to_scalars(metrics_dict)
         metrics["step"] = step
         self.metrics.append(metrics)
 
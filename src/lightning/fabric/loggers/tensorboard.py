@@ -23,6 +23,7 @@ from torch.nn import Module
 from typing_extensions import override
 
 from lightning.fabric.loggers.logger import Logger, rank_zero_experiment
+from lightning.fabric.utilities.apply_func import convert_tensors_to_scalars
 from lightning.fabric.utilities.cloud_io import _is_dir, get_filesystem
 from lightning.fabric.utilities.logger import _add_prefix, _convert_params, _flatten_dict
 from lightning.fabric.utilities.logger import _sanitize_params as _utils_sanitize_params
@@ -201,16 +202,15 @@ class TensorBoardLogger(Logger):
         assert rank_zero_only.rank == 0, "experiment tried to log from global_rank != 0"
 
         metrics = _add_prefix(metrics, self._prefix, self.LOGGER_JOIN_CHAR)
+        metrics = convert_tensors_to_scalars(metrics)
 
+        experiment = self.experiment
         for k, v in metrics.items():
-            if isinstance(v, Tensor):
-                v = v.item()
-
             if isinstance(v, dict):
-                self.experiment.add_scalars(k, v, step)
+                experiment.add_scalars(k, v, step)
             else:
                 try:
-                    self.experiment.add_scalar(k, v, step)
+                    experiment.add_scalar(k, v, step)
                 # TODO(fabric): specify the possible exception
                 except Exception as ex:
                     raise ValueError(
@@ -22,7 +22,7 @@ from torch.optim import LBFGS, Optimizer
 from typing_extensions import override
 
 from lightning.fabric.plugins.precision.precision import Precision
-from lightning.fabric.plugins.precision.utils import _convert_fp_tensor
+from lightning.fabric.plugins.precision.utils import _convert_fp_input, _convert_fp_tensor
 from lightning.fabric.utilities.imports import _TORCH_GREATER_EQUAL_2_4
 from lightning.fabric.utilities.types import Optimizable
 
@@ -65,7 +65,7 @@ class MixedPrecision(Precision):
 
     @override
     def convert_input(self, data: Any) -> Any:
-        return apply_to_collection(data, function=_convert_fp_tensor, dtype=Tensor, dst_type=self._desired_input_dtype)
+        return _convert_fp_input(data, self._desired_input_dtype)
 
     @override
     def convert_output(self, data: Any) -> Any:
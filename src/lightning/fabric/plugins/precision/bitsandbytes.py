@@ -33,6 +33,7 @@ from typing_extensions import Self, override
 from lightning.fabric.plugins.precision.precision import Precision
 from lightning.fabric.plugins.precision.utils import (
     _ClassReplacementContextManager,
+    _convert_fp_input,
     _convert_fp_tensor,
     _DtypeContextManager,
 )
@@ -150,7 +151,7 @@ class BitsandbytesPrecision(Precision):
 
     @override
     def convert_input(self, data: Any) -> Any:
-        return apply_to_collection(data, function=_convert_fp_tensor, dtype=Tensor, dst_type=self.dtype)
+        return _convert_fp_input(data, self.dtype)
 
     @override
     def convert_output(self, data: Any) -> Any:
@@ -21,7 +21,7 @@ from torch.nn import Module
 from typing_extensions import override
 
 from lightning.fabric.plugins.precision.precision import Precision
-from lightning.fabric.plugins.precision.utils import _convert_fp_tensor, _DtypeContextManager
+from lightning.fabric.plugins.precision.utils import _convert_fp_input, _convert_fp_tensor, _DtypeContextManager
 
 
 class DoublePrecision(Precision):
@@ -47,7 +47,7 @@ class DoublePrecision(Precision):
 
     @override
     def convert_input(self, data: Any) -> Any:
-        return apply_to_collection(data, function=_convert_fp_tensor, dtype=Tensor, dst_type=torch.double)
+        return _convert_fp_input(data, torch.double)
 
     @override
     def convert_output(self, data: Any) -> Any:
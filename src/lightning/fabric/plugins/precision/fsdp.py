@@ -23,7 +23,7 @@ from typing_extensions import get_args, override
 
 from lightning.fabric.plugins.precision.amp import _optimizer_handles_unscaling
 from lightning.fabric.plugins.precision.precision import Precision
-from lightning.fabric.plugins.precision.utils import _convert_fp_tensor, _DtypeContextManager
+from lightning.fabric.plugins.precision.utils import _convert_fp_input, _convert_fp_tensor, _DtypeContextManager
 from lightning.fabric.utilities.types import Optimizable
 
 if TYPE_CHECKING:
@@ -122,7 +122,7 @@ class FSDPPrecision(Precision):
 
     @override
     def convert_input(self, data: Any) -> Any:
-        return apply_to_collection(data, function=_convert_fp_tensor, dtype=Tensor, dst_type=self._desired_input_dtype)
+        return _convert_fp_input(data, self._desired_input_dtype)
 
     @override
     def convert_output(self, data: Any) -> Any:
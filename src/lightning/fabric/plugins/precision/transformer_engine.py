@@ -25,6 +25,7 @@ from typing_extensions import override
 from lightning.fabric.plugins.precision.precision import Precision
 from lightning.fabric.plugins.precision.utils import (
     _ClassReplacementContextManager,
+    _convert_fp_input,
     _convert_fp_tensor,
     _DtypeContextManager,
 )
@@ -141,7 +142,7 @@ class TransformerEnginePrecision(Precision):
 
     @override
     def convert_input(self, data: Any) -> Any:
-        return apply_to_collection(data, function=_convert_fp_tensor, dtype=Tensor, dst_type=self.weights_dtype)
+        return _convert_fp_input(data, self.weights_dtype)
 
     @override
     def convert_output(self, data: Any) -> Any:
@@ -15,11 +15,23 @@ from collections.abc import Mapping
 from typing import Any, Union
 
 import torch
+from lightning_utilities.core.apply_func import apply_to_collection
 from torch import Tensor
 
 
 def _convert_fp_tensor(tensor: Tensor, dst_type: Union[str, torch.dtype]) -> Tensor:
-    return tensor.to(dst_type) if torch.is_floating_point(tensor) else tensor
+    if not torch.is_floating_point(tensor) or tensor.dtype == dst_type:
+        # skip the dispatch of a no-op `.to()` call for every tensor in the batch
+        return tensor
+    return tensor.to(dst_type)
+
+
+def _convert_fp_input(data: Any, dst_type: Union[str, torch.dtype]) -> Any:
+    if data.__class__ is tuple:
+        # the `(args, kwargs)` pair of a forward call is not a flat collection of tensors, but its elements usually
+        # are. Converting them separately lets `apply_to_collection` take its fast path instead of the recursive walk
+        return tuple(apply_to_collection(d, function=_convert_fp_tensor, dtype=Tensor, dst_type=dst_type) for d in data)
+    return apply_to_collection(data, function=_convert_fp_tensor, dtype=Tensor, dst_type=dst_type)
 
 
 # do not support using as a decorator or else `torch.get_default_dtype` will get picked up at initialization
@@ -252,12 +252,22 @@ class XLAStrategy(ParallelStrategy):
             # XLA distributed requires that the data is on the XLA device
             obj = obj.to(self.root_device)
         else:
-            # support for arbitrary pickle-ables
-            buffer = io.BytesIO()
-            torch.save(obj, buffer)
-            obj = torch.tensor(  # type: ignore[assignment]
-                bytearray(buffer.getbuffer()), device=self.root_device, dtype=torch.float
-            )
+            # support for arbitrary pickle-ables. The serialized size can differ between processes, so the payload
+            # length of `src` is broadcast first and the other processes allocate a buffer to receive it
+            if self.global_rank == src:
+                buffer = io.BytesIO()
+                torch.save(obj, buffer)
+                # view the serialized bytes as a tensor instead of converting them one element at a time
+                data = torch.frombuffer(bytearray(buffer.getbuffer()), dtype=torch.uint8)
+                obj = data.to(self.root_device, dtype=torch.float)  # type: ignore[assignment]
+                length = torch.tensor([data.numel()], device=self.root_device, dtype=torch.long)
+            else:
+                length = torch.zeros(1, device=self.root_device, dtype=torch.long)
+            lengths = [length]
+            xm.collective_broadcast(lengths, root_ordinal=src)
+            if self.global_rank != src:
+                size = int(lengths[0].item())
+                obj = torch.zeros(size, device=self.root_device, dtype=torch.float)  # type: ignore[assignment]
 
         obj = [obj]
         xm.collective_broadcast(obj, root_ordinal=src)
@@ -126,11 +126,28 @@ def convert_tensors_to_scalars(data: Any) -> Any:
 
     """
 
-    def to_item(value: Tensor) -> Union[int, float, bool]:
+    tensors: list[Tensor] = []
+
+    def collect(value: Tensor) -> Tensor:
         if value.numel() != 1:
             raise ValueError(
                 f"The metric `{value}` does not contain a single element, thus it cannot be converted to a scalar."
             )
-        return value.item()
-
-    return apply_to_collection(data, Tensor, to_item)
+        tensors.append(value)
+        return value
+
+    apply_to_collection(data, Tensor, collect)
+
+    # stack the values that share a device and dtype so that each group needs a single device-to-host transfer
+    # instead of one synchronizing `.item()` call per tensor
+    groups: dict[tuple[torch.device, torch.dtype], list[int]] = {}
+    for i, tensor in enumerate(tensors):
+        groups.setdefault((tensor.device, tensor.dtype), []).append(i)
+    scalars: list[Union[int, float, bool]] = [0] * len(tensors)
+    for indices in groups.values():
+        values = torch.stack([tensors[i].detach().reshape(()) for i in indices]).tolist()
+        for i, value in zip(indices, values):
+            scalars[i] = value
+
+    scalars_iter = iter(scalars)
+    return apply_to_collection(data, Tensor, lambda _: next(scalars_iter))
@@ -87,7 +87,8 @@ def _atomic_save(checkpoint: dict[str, Any], filepath: Union[str, Path]) -> None
     # We use a transaction here to avoid file corruption if the save gets interrupted
     fs, urlpath = fsspec.core.url_to_fs(str(filepath))
     with fs.transaction, fs.open(urlpath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+        # `getbuffer` exposes the serialized bytes without the full copy that `getvalue` makes
+        f.write(bytesbuffer.getbuffer())
 
 
 def _is_object_storage(fs: AbstractFileSystem) -> bool:
@@ -174,4 +174,5 @@ def _add_prefix(
     """
     if not prefix:
         return metrics
-    return {f"{prefix}{separator}{k}": v for k, v in metrics.items()}
+    key_prefix = prefix + separator
+    return {key_prefix + k: v for k, v in metrics.items()}
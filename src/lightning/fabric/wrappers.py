@@ -39,6 +39,7 @@ from typing_extensions import override
 from lightning.fabric.plugins import Precision
 from lightning.fabric.strategies import Strategy
 from lightning.fabric.utilities import move_data_to_device
+from lightning.fabric.utilities.apply_func import _TransferableDataType
 from lightning.fabric.utilities.data import _set_sampler_epoch
 from lightning.fabric.utilities.device_dtype_mixin import _DeviceDtypeModuleMixin
 from lightning.fabric.utilities.types import Optimizable
@@ -322,10 +323,66 @@ class _FabricDataLoader:
 
         if self._device is None:
             yield from iter(self._dataloader)
+        elif self._device.type == "cuda" and self._can_prefetch:
+            yield from self._prefetch_to_cuda()
         else:
             for item in self._dataloader:
                 yield move_data_to_device(item, self._device)
 
+    @property
+    def _can_prefetch(self) -> bool:
+        # copies from pageable memory are synchronous, so reading ahead would only delay the batches. Stateful
+        # dataloaders are excluded because their saved state would be one batch ahead of the training loop
+        return bool(getattr(self._dataloader, "pin_memory", False)) and not callable(
+            getattr(self._dataloader, "state_dict", None)
+        )
+
+    def _prefetch_to_cuda(self) -> Generator[Any, None, None]:
+        """Copies the next batch to the device on a side stream while the current batch is being processed."""
+        assert self._device is not None
+        stream = torch.cuda.Stream(device=self._device)
+        batch, tensors, has_batch = None, [], False
+        for item in self._dataloader:
+            next_tensors: list[Tensor] = []
+            next_batch = _move_and_collect_tensors(item, self._device, stream, next_tensors)
+            if has_batch:
+                _wait_for_stream(tensors, stream)
+                yield batch
+            batch, tensors, has_batch = next_batch, next_tensors, True
+        if has_batch:
+            _wait_for_stream(tensors, stream)
+            yield batch
+
+
+def _move_and_collect_tensors(
+    batch: Any, device: torch.device, stream: torch.cuda.Stream, tensors: list[Tensor]
+) -> Any:
+    """Moves the tensors in the batch to the device on ``stream`` and appends them to ``tensors``.
+
+    Other objects that implement ``.to()`` are moved on the current stream: the tensors they hold can't be reached to
+    protect their memory with ``record_stream``, so it must not be allocated on the side stream.
+
+    """
+
+    def batch_to(data: Any) -> Any:
+        if not isinstance(data, Tensor):
+            return move_data_to_device(data, device)
+        with torch.cuda.stream(stream):
+            data = move_data_to_device(data, device)
+        tensors.append(data)
+        return data
+
+    return apply_to_collection(batch, dtype=_TransferableDataType, function=batch_to)
+
+
+def _wait_for_stream(tensors: list[Tensor], stream: torch.cuda.Stream) -> None:
+    """Makes the current stream wait for the copies issued on ``stream`` before the tensors get used."""
+    current_stream = torch.cuda.current_stream(stream.device)
+    current_stream.wait_stream(stream)
+    for tensor in tensors:
+        # the memory was allocated on the side stream, prevent the allocator from reusing it while still in use
+        tensor.record_stream(current_stream)
+
 
 def _unwrap_objects(collection: Any) -> Any:
     def _unwrap(
@@ -123,6 +123,8 @@ class StochasticWeightAveraging(Callback):
         self._avg_fn = avg_fn or self.avg_fn
         self._device = device
         self._model_contains_batch_norm: Optional[bool] = None
+        self._bn_modules: list[nn.modules.batchnorm._BatchNorm] = []
+        self._bn_modules_owner: Optional[nn.Module] = None
         self._average_model: Optional[pl.LightningModule] = None
         self._initialized = False
         self._swa_scheduler: Optional[LRScheduler] = None
@@ -151,7 +153,19 @@ class StochasticWeightAveraging(Callback):
             raise MisconfigurationException("SWA does not currently support sharded models.")
 
         # copy the model before moving it to accelerator device.
-        self._average_model = deepcopy(pl_module)
+        if self.n_averaged is None and self._latest_update_epoch < 0:
+            # nothing was averaged yet, so the first update overwrites the averaged parameters: only allocate them
+            # instead of copying their values. Pre-populating the memo makes `deepcopy` reuse these allocations.
+            # Parameter subclasses (including uninitialized parameters) go through their own `__deepcopy__`
+            memo = {
+                id(param): nn.Parameter(torch.zeros_like(param, device=self._device), requires_grad=param.requires_grad)
+                for param in pl_module.parameters()
+                if type(param) is nn.Parameter
+            }
+            self._average_model = deepcopy(pl_module, memo)
+        else:
+            # a previous fit already started averaging, the next update builds on the copied values
+            self._average_model = deepcopy(pl_module)
 
     @override
     def on_fit_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
@@ -165,7 +179,9 @@ class StochasticWeightAveraging(Callback):
         if isinstance(self._swa_epoch_start, float):
             self._swa_epoch_start = int(trainer.max_epochs * self._swa_epoch_start)
 
-        self._model_contains_batch_norm = self.pl_module_contains_batch_norm(pl_module)
+        # refresh the cached batch norm layers in case the module changed since a previous fit
+        self._bn_modules_owner = None
+        self._model_contains_batch_norm = bool(self._batch_norm_modules(pl_module))
 
         self._max_epochs = trainer.max_epochs
         if self._model_contains_batch_norm:
@@ -178,78 +194,25 @@ class StochasticWeightAveraging(Callback):
 
     @override
     def on_train_epoch_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
-        if (not self._initialized) and (self.swa_start <= trainer.current_epoch <= self.swa_end):
-            self._initialized = True
+        swa_start, swa_end = self.swa_start, self.swa_end
+        in_swa = swa_start <= trainer.current_epoch <= swa_end
 
-            # move average model to request device.
-            assert self._average_model is not None
-            self._average_model = self._average_model.to(self._device or pl_module.device)
-
-            optimizer = trainer.optimizers[0]
-            if isinstance(self._swa_lrs, float):
-                self._swa_lrs = [self._swa_lrs] * len(optimizer.param_groups)
-
-            for lr, group in zip(self._swa_lrs, optimizer.param_groups):
-                group["initial_lr"] = lr
-
-            assert trainer.max_epochs is not None
-            self._swa_scheduler = cast(
-                LRScheduler,
-                SWALR(
-                    optimizer,
-                    swa_lr=self._swa_lrs,  # type: ignore[arg-type]
-                    anneal_epochs=self._annealing_epochs,
-                    anneal_strategy=self._annealing_strategy,
-                    last_epoch=trainer.max_epochs if self._annealing_strategy == "cos" else -1,
-                ),
-            )
-            if self._scheduler_state is not None:
-                # Restore scheduler state from checkpoint
-                self._swa_scheduler.load_state_dict(self._scheduler_state)
-            elif trainer.current_epoch != self.swa_start:
-                # Log a warning if we're initializing after start without any checkpoint data,
-                # as behaviour will be different compared to having checkpoint data.
-                rank_zero_warn(
-                    "SWA is initializing after swa_start without any checkpoint data. "
-                    "This may be caused by loading a checkpoint from an older version of PyTorch Lightning."
-                )
-
-            # We assert that there is only one optimizer on fit start
-            default_scheduler_cfg = LRSchedulerConfig(self._swa_scheduler)
-            assert default_scheduler_cfg.interval == "epoch"
-            assert default_scheduler_cfg.frequency == 1
-
-            if trainer.lr_scheduler_configs:
-                scheduler_cfg = trainer.lr_scheduler_configs[0]
-                if scheduler_cfg.interval != "epoch" or scheduler_cfg.frequency != 1:
-                    rank_zero_warn(f"SWA is currently only supported every epoch. Found {scheduler_cfg}")
-                rank_zero_info(
-                    f"Swapping scheduler `{scheduler_cfg.scheduler.__class__.__name__}`"
-                    f" for `{self._swa_scheduler.__class__.__name__}`"
-                )
-                trainer.lr_scheduler_configs[0] = default_scheduler_cfg
-            else:
-                trainer.lr_scheduler_configs.append(default_scheduler_cfg)
-
-            if self.n_averaged is None:
-                self.n_averaged = torch.tensor(self._init_n_averaged, dtype=torch.long, device=pl_module.device)
-
-        if (self.swa_start <= trainer.current_epoch <= self.swa_end) and (
-            trainer.current_epoch > self._latest_update_epoch
-        ):
-            assert self.n_averaged is not None
-            assert self._average_model is not None
-            self.update_parameters(self._average_model, pl_module, self.n_averaged, self._avg_fn)
-            self._latest_update_epoch = trainer.current_epoch
+        if not self._initialized and in_swa:
+            self._initialize_swa(trainer, pl_module)
+
+        if in_swa:
+            self._update_average_model(trainer, pl_module)
 
         # Note: No > here in case the callback is saved with the model and training continues
-        if trainer.current_epoch == self.swa_end + 1:
-            # Transfer weights from average model to pl_module
-            assert self._average_model is not None
-            self.transfer_weights(self._average_model, pl_module)
+        if trainer.current_epoch == swa_end + 1:
+            # the averaged weights are only allocated until the first update, never transfer them before that
+            if self._latest_update_epoch >= 0:
+                # Transfer weights from average model to pl_module
+                assert self._average_model is not None
+                self.transfer_weights(self._average_model, pl_module)
 
-            # Reset BatchNorm for update
-            self.reset_batch_norm_and_save_state(pl_module)
+                # Reset BatchNorm for update
+                self.reset_batch_norm_and_save_state(pl_module)
 
             # There is no need to perform either backward or optimizer.step as we are
             # performing only one pass over the train data-loader to compute activation statistics
@@ -274,38 +237,40 @@ class StochasticWeightAveraging(Callback):
             assert trainer.fit_loop.max_epochs is not None
             trainer.fit_loop.max_epochs -= 1
             self.reset_momenta()
-        elif trainer.current_epoch - 1 == self.swa_end:
+        elif trainer.current_epoch - 1 == self.swa_end and self._latest_update_epoch >= 0:
             # Last SWA epoch. Transfer weights from average model to pl_module
             assert self._average_model is not None
             self.transfer_weights(self._average_model, pl_module)
 
     @staticmethod
     def transfer_weights(src_pl_module: "pl.LightningModule", dst_pl_module: "pl.LightningModule") -> None:
-        for src_param, dst_param in zip(src_pl_module.parameters(), dst_pl_module.parameters()):
-            dst_param.detach().copy_(src_param.to(dst_param.device))
+        dst_params = [dst_param.detach() for dst_param in dst_pl_module.parameters()]
+        src_params = [src_param.detach() for src_param in src_pl_module.parameters()]
+        if dst_params:
+            # `copy_` handles the transfer across devices, no need for an intermediate `.to()` copy
+            torch._foreach_copy_(dst_params, src_params)
 
     def reset_batch_norm_and_save_state(self, pl_module: "pl.LightningModule") -> None:
         """Adapted from https://github.com/pytorch/pytorch/blob/v1.7.1/torch/optim/swa_utils.py#L140-L154."""
         self.momenta = {}
-        for module in pl_module.modules():
-            if not isinstance(module, nn.modules.batchnorm._BatchNorm):
-                continue
+        running_means, running_vars, num_batches_tracked = [], [], []
+        bn_modules = self._batch_norm_modules(pl_module)
+        for module in bn_modules:
             assert module.running_mean is not None
-            module.running_mean = torch.zeros_like(
-                module.running_mean,
-                device=pl_module.device,
-                dtype=module.running_mean.dtype,
-            )
+            running_means.append(module.running_mean)
             assert module.running_var is not None
-            module.running_var = torch.ones_like(
-                module.running_var,
-                device=pl_module.device,
-                dtype=module.running_var.dtype,
-            )
+            running_vars.append(module.running_var)
             self.momenta[module] = module.momentum
             module.momentum = None
             assert module.num_batches_tracked is not None
-            module.num_batches_tracked *= 0
+            num_batches_tracked.append(module.num_batches_tracked)
+        if not bn_modules:
+            return
+        # reset the statistics of all layers with a few multi-tensor kernels instead of one launch per layer
+        torch._foreach_zero_(running_means)
+        torch._foreach_zero_(running_vars)
+        torch._foreach_add_(running_vars, 1.0)
+        torch._foreach_zero_(num_batches_tracked)
 
     def reset_momenta(self) -> None:
         """Adapted from https://github.com/pytorch/pytorch/blob/v1.7.1/torch/optim/swa_utils.py#L164-L165."""
@@ -317,12 +282,24 @@ class StochasticWeightAveraging(Callback):
         average_model: "pl.LightningModule", model: "pl.LightningModule", n_averaged: Tensor, avg_fn: _AVG_FN
     ) -> None:
         """Adapted from https://github.com/pytorch/pytorch/blob/v1.7.1/torch/optim/swa_utils.py#L104-L112."""
-        for p_swa, p_model in zip(average_model.parameters(), model.parameters()):
-            device = p_swa.device
-            p_swa_ = p_swa.detach()
-            p_model_ = p_model.detach().to(device)
-            src = p_model_ if n_averaged == 0 else avg_fn(p_swa_, p_model_, n_averaged.to(device))
-            p_swa_.copy_(src)
+        swa_params = [p_swa.detach() for p_swa in average_model.parameters()]
+        model_params = _to_averaged_devices([p_model.detach() for p_model in model.parameters()], swa_params)
+        if not swa_params:
+            # the multi-tensor kernels don't accept empty lists
+            n_averaged += 1
+            return
+        # read the counter once so that the parameters don't each trigger a device synchronization
+        n = int(n_averaged.item())
+        if n == 0:
+            torch._foreach_copy_(swa_params, model_params)
+        elif avg_fn is StochasticWeightAveraging.avg_fn:
+            # the default average is a linear interpolation: fuse it into a single multi-tensor kernel
+            torch._foreach_lerp_(swa_params, model_params, 1.0 / (n + 1))
+        else:
+            devices = {p_swa_.device for p_swa_ in swa_params}
+            n_averaged_per_device = {device: n_averaged.to(device) for device in devices}
+            for p_swa_, p_model_ in zip(swa_params, model_params):
+                p_swa_.copy_(avg_fn(p_swa_, p_model_, n_averaged_per_device[p_swa_.device]))
         n_averaged += 1
 
     @staticmethod
@@ -346,6 +323,81 @@ class StochasticWeightAveraging(Callback):
         self._scheduler_state = state_dict["scheduler_state"]
         self._load_average_model_state(state_dict["average_model_state"])
 
+    def _initialize_swa(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self._initialized = True
+
+        # move average model to request device.
+        assert self._average_model is not None
+        self._average_model = self._average_model.to(self._device or pl_module.device)
+
+        optimizer = trainer.optimizers[0]
+        # param groups can be added during training (e.g. by `BackboneFinetuning`), so expand the value only now
+        if isinstance(self._swa_lrs, float):
+            self._swa_lrs = [self._swa_lrs] * len(optimizer.param_groups)
+
+        for lr, group in zip(self._swa_lrs, optimizer.param_groups):
+            group["initial_lr"] = lr
+
+        assert trainer.max_epochs is not None
+        self._swa_scheduler = cast(
+            LRScheduler,
+            SWALR(
+                optimizer,
+                swa_lr=self._swa_lrs,  # type: ignore[arg-type]
+                anneal_epochs=self._annealing_epochs,
+                anneal_strategy=self._annealing_strategy,
+                last_epoch=trainer.max_epochs if self._annealing_strategy == "cos" else -1,
+            ),
+        )
+        if self._scheduler_state is not None:
+            # Restore scheduler state from checkpoint
+            self._swa_scheduler.load_state_dict(self._scheduler_state)
+        elif trainer.current_epoch != self.swa_start:
+            # Log a warning if we're initializing after start without any checkpoint data,
+            # as behaviour will be different compared to having checkpoint data.
+            rank_zero_warn(
+                "SWA is initializing after swa_start without any checkpoint data. "
+                "This may be caused by loading a checkpoint from an older version of PyTorch Lightning."
+            )
+
+        # We assert that there is only one optimizer on fit start
+        default_scheduler_cfg = LRSchedulerConfig(self._swa_scheduler)
+        assert default_scheduler_cfg.interval == "epoch"
+        assert default_scheduler_cfg.frequency == 1
+
+        if trainer.lr_scheduler_configs:
+            scheduler_cfg = trainer.lr_scheduler_configs[0]
+            if scheduler_cfg.interval != "epoch" or scheduler_cfg.frequency != 1:
+                rank_zero_warn(f"SWA is currently only supported every epoch. Found {scheduler_cfg}")
+            rank_zero_info(
+                f"Swapping scheduler `{scheduler_cfg.scheduler.__class__.__name__}`"
+                f" for `{self._swa_scheduler.__class__.__name__}`"
+            )
+            trainer.lr_scheduler_configs[0] = default_scheduler_cfg
+        else:
+            trainer.lr_scheduler_configs.append(default_scheduler_cfg)
+
+        if self.n_averaged is None:
+            self.n_averaged = torch.tensor(self._init_n_averaged, dtype=torch.long, device=pl_module.device)
+
+    def _batch_norm_modules(self, pl_module: nn.Module) -> list[nn.modules.batchnorm._BatchNorm]:
+        # the list is cached per module so that the module tree is only walked once per fit
+        if self._bn_modules_owner is not pl_module:
+            self._bn_modules = [
+                module for module in pl_module.modules() if isinstance(module, nn.modules.batchnorm._BatchNorm)
+            ]
+            self._bn_modules_owner = pl_module
+        return self._bn_modules
+
+    def _update_average_model(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        if trainer.current_epoch <= self._latest_update_epoch:
+            # the weights of this epoch were already averaged, e.g. before the checkpoint we resumed from was saved
+            return
+        assert self.n_averaged is not None
+        assert self._average_model is not None
+        self.update_parameters(self._average_model, pl_module, self.n_averaged, self._avg_fn)
+        self._latest_update_epoch = trainer.current_epoch
+
     @staticmethod
     def _clear_schedulers(trainer: "pl.Trainer") -> None:
         # If we have scheduler state saved, clear the scheduler configs so that we don't try to
@@ -363,3 +415,27 @@ class StochasticWeightAveraging(Callback):
         if self._average_model is None:
             return
         self._average_model.load_state_dict(model_state)
+
+
+def _to_averaged_devices(model_params: list[Tensor], swa_params: list[Tensor]) -> list[Tensor]:
+    """Moves the model parameters to the devices of the averaged parameters.
+
+    Copies from a CUDA device to the CPU are staged in pinned memory and issued asynchronously, so that the stream is
+    synchronized once per source device rather than after every copy.
+
+    """
+    moved = []
+    sync_devices = set()
+    for p_model, p_swa in zip(model_params, swa_params):
+        if p_model.device == p_swa.device:
+            moved.append(p_model)
+        elif p_model.device.type == "cuda" and p_swa.device.type == "cpu":
+            staged = torch.empty_like(p_model, device="cpu", pin_memory=True)
+            staged.copy_(p_model, non_blocking=True)
+            moved.append(staged)
+            sync_devices.add(p_model.device)
+        else:
+            moved.append(p_model.to(p_swa.device))
+    for device in sync_devices:
+        torch.cuda.current_stream(device).synchronize()
+    return moved
@@ -22,6 +22,7 @@ import re
 import tempfile
 from argparse import Namespace
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from time import time
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
@@ -253,20 +254,14 @@ class MLFlowLogger(Logger):
         metrics_list: list[Metric] = []
 
         timestamp_ms = int(time() * 1000)
+        step = 0 if step is None else step
         for k, v in metrics.items():
             if isinstance(v, str):
                 log.warning(f"Discarding metric with string value {k}={v}.")
                 continue
 
-            new_k = re.sub("[^a-zA-Z0-9_/. -]+", "", k)
-            if k != new_k:
-                rank_zero_warn(
-                    "MLFlow only allows '_', '/', '.' and ' ' special characters in metric name."
-                    f" Replacing {k} with {new_k}.",
-                    category=RuntimeWarning,
-                )
-                k = new_k
-            metrics_list.append(Metric(key=k, value=v, timestamp=timestamp_ms, step=step or 0))
+            k = _sanitize_metric_name(k)
+            metrics_list.append(Metric(key=k, value=v, timestamp=timestamp_ms, step=step))
 
         self.experiment.log_batch(run_id=self.run_id, metrics=metrics_list, **self._log_batch_kwargs)
 
@@ -396,3 +391,16 @@ def _get_resolve_tags() -> Callable:
         resolve_tags = lambda tags: tags
 
     return resolve_tags
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_metric_name(name: str) -> str:
+    # metric names rarely change between steps, the cache avoids the substitution and the repeated warning
+    new_name = re.sub("[^a-zA-Z0-9_/. -]+", "", name)
+    if name != new_name:
+        rank_zero_warn(
+            "MLFlow only allows '_', '/', '.' and ' ' special characters in metric name."
+            f" Replacing {name} with {new_name}.",
+            category=RuntimeWarning,
+        )
+    return new_name
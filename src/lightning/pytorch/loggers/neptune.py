@@ -383,9 +383,9 @@ class NeptuneLogger(Logger):
     @property
     @rank_zero_experiment
     def run(self) -> "Run":
-        import neptune
-
         if not self._run_instance:
+            import neptune
+
             self._run_instance = neptune.init_run(**self._neptune_init_args)
             self._retrieve_run_data()
             # make sure that we've log integration version for newly created
@@ -454,11 +454,14 @@ class NeptuneLogger(Logger):
         """
         if rank_zero_only.rank != 0:
             raise ValueError("run tried to log from global_rank != 0")
+        if not metrics:
+            return
 
         metrics = _add_prefix(metrics, self._prefix, self.LOGGER_JOIN_CHAR)
 
+        run = self.run
         for key, val in metrics.items():
-            self.run[key].append(val, step=step)
+            run[key].append(val, step=step)
 
     @override
     @rank_zero_only
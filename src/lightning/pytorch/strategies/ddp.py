@@ -14,7 +14,7 @@
 import logging
 from contextlib import nullcontext
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, cast
 
 import torch
 import torch.distributed
@@ -103,6 +103,7 @@ class DDPStrategy(ParallelStrategy):
         self._process_group_backend: Optional[str] = process_group_backend
         self._timeout: Optional[timedelta] = timeout
         self._start_method = start_method
+        self._static_graph_delay_done = False
 
     @property
     def is_distributed(self) -> bool:  # pragma: no-cover
@@ -282,6 +283,7 @@ class DDPStrategy(ParallelStrategy):
         assert isinstance(self.model, pl.LightningModule)
         self.model = self._setup_model(self.model)
         self._register_ddp_hooks()
+        self._static_graph_delay_done = False
 
     def determine_ddp_device_ids(self) -> Optional[list[int]]:
         if self.root_device.type == "cpu":
@@ -316,6 +318,26 @@ class DDPStrategy(ParallelStrategy):
         if not self.lightning_module.automatic_optimization:
             prepare_for_backward(self.model, closure_loss)
 
+    @override
+    def post_backward(self, closure_loss: Tensor) -> None:
+        """Run after precision plugin executes backward."""
+        if self._static_graph_delay_done or not isinstance(self.model, DistributedDataParallel):
+            return
+        assert self.lightning_module is not None
+        if self.lightning_module.automatic_optimization or not self.model.static_graph:
+            return
+        if not self.model.require_backward_grad_sync:
+            return
+        self._static_graph_delay_done = True
+        if getattr(self.model, "_static_graph_delay_allreduce_enqueued", False):
+            # DDP already flushed the buckets itself
+            return
+        # With manual optimization the forward redirection disables gradient sync during the forward, so DDP does not
+        # flush the buckets after the first static-graph backward. Do it here once so the gradients get reduced.
+        reducer = cast(torch._C._distributed_c10d.Reducer, self.model.reducer)
+        reducer._delay_all_reduce()
+        self.model._static_graph_delay_allreduce_enqueued = True
+
     @override
     def model_to_device(self) -> None:
         log.debug(f"{self.__class__.__name__}: moving model to device [{self.root_device}]...")
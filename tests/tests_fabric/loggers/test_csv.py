@@ -96,6 +96,8 @@ def test_log_metrics(tmp_path, step_idx):
     logger = CSVLogger(tmp_path)
     metrics = {"float": 0.3, "int": 1, "FloatTensor": torch.tensor(0.1), "IntTensor": torch.tensor(1)}
     logger.log_metrics(metrics, step_idx)
+    assert not any(isinstance(v, torch.Tensor) for v in logger.experiment.metrics[-1].values())
+    assert "step" not in metrics
     logger.save()
 
     path_csv = os.path.join(logger.log_dir, _ExperimentWriter.NAME_METRICS_FILE)
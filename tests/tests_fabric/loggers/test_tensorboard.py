@@ -110,6 +110,11 @@ def test_tensorboard_log_metrics(tmp_path, step_idx):
     metrics = {"float": 0.3, "int": 1, "FloatTensor": torch.tensor(0.1), "IntTensor": torch.tensor(1)}
     logger.log_metrics(metrics, step_idx)
 
+    logger._experiment = Mock()
+    logger.log_metrics({"FloatTensor": torch.tensor(0.1), "dict": {"IntTensor": torch.tensor(1)}}, step_idx)
+    logger.experiment.add_scalar.assert_called_once_with("FloatTensor", pytest.approx(0.1), step_idx)
+    logger.experiment.add_scalars.assert_called_once_with("dict", {"IntTensor": 1}, step_idx)
+
 
 def test_tensorboard_log_hyperparams(tmp_path):
     logger = TensorBoardLogger(tmp_path)
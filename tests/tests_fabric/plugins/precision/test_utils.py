@@ -1,7 +1,14 @@
+from unittest import mock
+
 import pytest
 import torch
 
-from lightning.fabric.plugins.precision.utils import _ClassReplacementContextManager, _DtypeContextManager
+from lightning.fabric.plugins.precision.utils import (
+    _ClassReplacementContextManager,
+    _convert_fp_input,
+    _convert_fp_tensor,
+    _DtypeContextManager,
+)
 
 
 def test_dtype_context_manager():
@@ -46,3 +53,30 @@ def test_class_replacement_context_manager():
     assert isinstance(linear, original_linear)
     assert isinstance(layernorm, original_layernorm)
     assert hasattr(linear, "forward")
+
+
+def test_convert_fp_tensor():
+    tensor = torch.rand(2, dtype=torch.float32)
+    assert _convert_fp_tensor(tensor, torch.float16).dtype == torch.float16
+    assert _convert_fp_tensor(tensor, torch.double).dtype == torch.double
+
+    # tensors that already have the target dtype and non-floating point tensors are returned without dispatching
+    int_tensor = torch.tensor([1, 2])
+    with mock.patch.object(torch.Tensor, "to") as to_mock:
+        assert _convert_fp_tensor(tensor, torch.float32) is tensor
+        assert _convert_fp_tensor(int_tensor, torch.float16) is int_tensor
+    to_mock.assert_not_called()
+
+
+def test_convert_fp_input():
+    args = (torch.rand(2), torch.tensor([1, 2]), "foo")
+    kwargs = {"x": torch.rand(2), "y": [torch.rand(2)]}
+    new_args, new_kwargs = _convert_fp_input((args, kwargs), torch.float16)
+    assert isinstance(new_args, tuple)
+    assert new_args[0].dtype == torch.float16
+    assert new_args[1] is args[1]
+    assert new_args[2] == "foo"
+    assert new_kwargs["x"].dtype == torch.float16
+    assert new_kwargs["y"][0].dtype == torch.float16
+
+    assert _convert_fp_input(torch.rand(2), torch.float16).dtype == torch.float16
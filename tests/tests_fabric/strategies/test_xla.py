@@ -70,6 +70,11 @@ def broadcast_on_tpu_fn(strategy):
     assert result[3].device.type == "xla"  # the original device is preserved
     assert result[3].dtype == torch.bfloat16
 
+    # test broadcasting an object whose serialized size differs between processes
+    obj = "x" * (strategy.global_rank + 1)
+    result = strategy.broadcast(obj, src=src)
+    assert result == "x" * (src + 1)
+
 
 @RunIf(tpu=True)
 @mock.patch.dict(os.environ, os.environ.copy(), clear=True)
@@ -408,6 +408,127 @@ def test_fabric_dataloader_device_placement(src_device_str, dest_device_str):
     assert torch.equal(batch1["data"], torch.tensor([2, 3], device=dest_device))
 
 
+@pytest.mark.parametrize("pin_memory", [False, True])
+def test_fabric_dataloader_cuda_prefetch(pin_memory):
+    """Test that the FabricDataLoader copies the next batch on a side stream only if the dataloader pins memory."""
+    events = []
+    dataloader = DataLoader(range(3), batch_size=1)
+    dataloader.pin_memory = pin_memory
+    fabric_dataloader = _FabricDataLoader(dataloader=dataloader, device=torch.device("cuda", 0))
+
+    def move(data, device):
+        events.append(("move", data.item()))
+        return data
+
+    current_stream = Mock()
+    current_stream.wait_stream.side_effect = lambda stream: events.append(("wait",))
+    with (
+        mock.patch("lightning.fabric.wrappers.move_data_to_device", side_effect=move),
+        mock.patch("torch.cuda.Stream") as stream_mock,
+        mock.patch("torch.cuda.stream"),
+        mock.patch("torch.cuda.current_stream", return_value=current_stream),
+        mock.patch.object(
+            torch.Tensor, "record_stream", lambda tensor, stream: events.append(("record", tensor.item()))
+        ),
+    ):
+        for batch in fabric_dataloader:
+            events.append(("yield", batch.item()))
+
+    if not pin_memory:
+        stream_mock.assert_not_called()
+        assert events == [("move", 0), ("yield", 0), ("move", 1), ("yield", 1), ("move", 2), ("yield", 2)]
+        return
+
+    stream_mock.assert_called_once_with(device=torch.device("cuda", 0))
+    assert events == [
+        ("move", 0),
+        ("move", 1),
+        ("wait",),
+        ("record", 0),
+        ("yield", 0),
+        ("move", 2),
+        ("wait",),
+        ("record", 1),
+        ("yield", 1),
+        ("wait",),
+        ("record", 2),
+        ("yield", 2),
+    ]
+    assert all(call.args == (stream_mock.return_value,) for call in current_stream.wait_stream.mock_calls)
+
+
+def test_fabric_dataloader_cuda_prefetch_custom_transferable():
+    """Test that objects implementing `.to()` are moved on the current stream, since the tensors they hold can't be
+    recorded on it."""
+    events = []
+    side_stream_active = False
+
+    class Batch:
+        def __init__(self, index):
+            self.index = index
+
+        def to(self, device):
+            events.append(("batch", self.index, side_stream_active))
+            return self
+
+    def move(data, device):
+        if isinstance(data, torch.Tensor):
+            events.append(("tensor", data.item(), side_stream_active))
+            return data
+        return data.to(device)
+
+    def set_side_stream_active(active):
+        nonlocal side_stream_active
+        side_stream_active = active
+
+    samples = [{"batch": Batch(0), "data": torch.tensor(0)}, {"batch": Batch(1), "data": torch.tensor(1)}]
+    dataloader = DataLoader(samples, batch_size=None)
+    dataloader.pin_memory = True
+    fabric_dataloader = _FabricDataLoader(dataloader=dataloader, device=torch.device("cuda", 0))
+
+    with (
+        mock.patch("lightning.fabric.wrappers.move_data_to_device", side_effect=move),
+        mock.patch("torch.cuda.Stream"),
+        mock.patch("torch.cuda.stream") as stream_context_mock,
+        mock.patch("torch.cuda.current_stream"),
+        mock.patch.object(torch.Tensor, "record_stream") as record_stream_mock,
+    ):
+        stream_context_mock.return_value.__enter__.side_effect = lambda *_: set_side_stream_active(True)
+        stream_context_mock.return_value.__exit__.side_effect = lambda *_: set_side_stream_active(False)
+        batches = list(fabric_dataloader)
+
+    assert [batch["batch"].index for batch in batches] == [0, 1]
+    # only the plain tensors get allocated on the side stream and recorded on the current stream
+    assert events == [("batch", 0, False), ("tensor", 0, True), ("batch", 1, False), ("tensor", 1, True)]
+    assert record_stream_mock.call_count == 2
+
+
+def test_fabric_dataloader_no_prefetch_for_stateful_dataloader():
+    """Test that the FabricDataLoader does not read ahead if the dataloader state can be saved mid-epoch."""
+    dataloader = DataLoader(range(3), batch_size=1)
+    dataloader.pin_memory = True
+    dataloader.state_dict = Mock()
+    fabric_dataloader = _FabricDataLoader(dataloader=dataloader, device=torch.device("cuda", 0))
+    assert not fabric_dataloader._can_prefetch
+
+
+@RunIf(min_cuda_gpus=1)
+def test_fabric_dataloader_cuda_prefetch_values():
+    """Test that the prefetched batches arrive on the device with the right values and in order."""
+    samples = [{"data": torch.full((4,), float(i)), "index": i} for i in range(5)]
+    dataloader = DataLoader(samples, batch_size=2, pin_memory=True)
+    fabric_dataloader = _FabricDataLoader(dataloader=dataloader, device=torch.device("cuda", 0))
+    assert fabric_dataloader._can_prefetch
+
+    batches = list(fabric_dataloader)
+    assert len(batches) == 3
+    for i, batch in enumerate(batches):
+        expected_index = torch.arange(2 * i, min(2 * i + 2, 5))
+        assert batch["data"].device == torch.device("cuda", 0)
+        assert torch.equal(batch["index"].cpu(), expected_index)
+        assert torch.equal(batch["data"].cpu(), expected_index.float().unsqueeze(1).expand(-1, 4))
+
+
 @pytest.mark.parametrize("use_batch_sampler", [False, True])
 def test_fabric_dataloader_distributed_sampler_set_epoch(use_batch_sampler):
     """Test that the FabricDataLoader calls `set_epoch()` on the wrapped sampler if applicable."""
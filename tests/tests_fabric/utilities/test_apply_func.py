@@ -57,3 +57,18 @@ def test_convert_tensors_to_scalars():
 
     with pytest.raises(ValueError, match="does not contain a single element"):
         convert_tensors_to_scalars({"tensor": torch.tensor([1, 2, 3])})
+
+    data = {
+        "float": torch.tensor(0.5),
+        "nested": [torch.tensor(3), (torch.tensor([[True]]), "foo")],
+        "double": torch.tensor(1.5, dtype=torch.double, requires_grad=True),
+        "other": 4.0,
+    }
+    result = convert_tensors_to_scalars(data)
+    assert result == {"float": 0.5, "nested": [3, (True, "foo")], "double": 1.5, "other": 4.0}
+    assert type(result["nested"][0]) is int
+    assert type(result["nested"][1][0]) is bool
+
+    # a new collection is returned even if it holds no tensors, callers are free to modify it
+    data = {"scalar": 1.0}
+    assert convert_tensors_to_scalars(data) is not data
@@ -14,10 +14,11 @@
 import os
 
 import fsspec
+import torch
 from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
 
-from lightning.fabric.utilities.cloud_io import _is_dir, get_filesystem
+from lightning.fabric.utilities.cloud_io import _atomic_save, _is_dir, _load, get_filesystem
 
 
 def test_get_filesystem_custom_filesystem():
@@ -90,3 +91,12 @@ def test_is_dir_with_object_storage_filesystem():
     assert _is_dir(get_filesystem(s3_directory), s3_directory, strict=True)
     assert not _is_dir(get_filesystem(s3_directory), s3_file)
     assert not _is_dir(get_filesystem(s3_directory), s3_file, strict=True)
+
+
+def test_atomic_save(tmp_path):
+    path = tmp_path / "checkpoint.ckpt"
+    checkpoint = {"weight": torch.arange(10.0), "epoch": 3}
+    _atomic_save(checkpoint, path)
+    loaded = _load(path)
+    assert loaded["epoch"] == 3
+    assert torch.equal(loaded["weight"], checkpoint["weight"])
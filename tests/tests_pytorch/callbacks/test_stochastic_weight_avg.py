@@ -230,6 +230,138 @@ def test_swa_raises():
         StochasticWeightAveraging(swa_epoch_start=-1, swa_lrs=0.1)
     with pytest.raises(MisconfigurationException, match="positive float, or a list of positive floats"):
         StochasticWeightAveraging(swa_epoch_start=5, swa_lrs=[0.2, 1])
+    with pytest.raises(MisconfigurationException, match="`avg_fn` should be callable"):
+        StochasticWeightAveraging(swa_lrs=0.1, avg_fn=0.5)
+
+
+@pytest.mark.parametrize("custom_avg_fn", [False, True])
+@pytest.mark.parametrize(
+    "model_device",
+    [
+        "cpu",
+        pytest.param("cuda", marks=RunIf(min_cuda_gpus=1)),
+        pytest.param("multi_cuda", marks=RunIf(min_cuda_gpus=2)),
+    ],
+)
+def test_swa_update_parameters(custom_avg_fn, model_device):
+    """Test that the multi-tensor update matches the per-parameter running average."""
+    average_model = SwaTestModel()
+    if model_device == "multi_cuda":
+        # the copies from every source device need to complete before the averaged parameters are updated
+        model = SwaTestModel().to("cuda:0")
+        model.layer[-1].to("cuda:1")
+    else:
+        model = SwaTestModel().to(model_device)
+    avg_fn = StochasticWeightAveraging.avg_fn
+    if custom_avg_fn:
+        # a distinct function object with the same math takes the per-parameter path
+        def avg_fn(averaged_model_parameter, model_parameter, num_averaged):
+            return StochasticWeightAveraging.avg_fn(averaged_model_parameter, model_parameter, num_averaged)
+
+    n_averaged = torch.tensor(0, dtype=torch.long)
+
+    StochasticWeightAveraging.update_parameters(average_model, model, n_averaged, avg_fn)
+    assert n_averaged == 1
+    for p_swa, p_model in zip(average_model.parameters(), model.parameters()):
+        torch.testing.assert_close(p_swa, p_model.cpu())
+
+    expected = [p.detach().clone() for p in average_model.parameters()]
+    with torch.no_grad():
+        for p in model.parameters():
+            p.add_(1.0)
+    for p_expected, p_model in zip(expected, model.parameters()):
+        p_expected.copy_(p_expected + (p_model.detach().cpu() - p_expected) / 2)
+
+    StochasticWeightAveraging.update_parameters(average_model, model, n_averaged, avg_fn)
+    assert n_averaged == 2
+    for p_swa, p_expected in zip(average_model.parameters(), expected):
+        torch.testing.assert_close(p_swa, p_expected)
+
+
+def test_swa_setup_keeps_parameter_subclasses():
+    """Test that the averaged model keeps the type of parameter subclasses."""
+
+    class CustomParameter(nn.Parameter):
+        pass
+
+    model = SwaTestModel()
+    model.layer[0].weight = CustomParameter(model.layer[0].weight.detach().clone())
+    swa = StochasticWeightAveraging(swa_lrs=0.1)
+    swa.setup(mock.Mock(), model, "fit")
+    average_layer = swa._average_model.layer[0]
+    assert type(average_layer.weight) is CustomParameter
+    assert type(average_layer.bias) is nn.Parameter
+    assert average_layer.weight is not model.layer[0].weight
+    torch.testing.assert_close(average_layer.weight, model.layer[0].weight)
+
+
+def test_swa_setup_copies_weights_once_averaging_started():
+    """Test that the averaged parameters are only left unset while no averaging state exists."""
+    model = SwaTestModel()
+    swa = StochasticWeightAveraging(swa_lrs=0.1)
+    swa.setup(mock.Mock(), model, "fit")
+    # the placeholder values are deterministic so that checkpoints saved before the first update are reproducible
+    for p_swa in swa._average_model.parameters():
+        assert torch.equal(p_swa, torch.zeros_like(p_swa))
+
+    # e.g. a second call to `fit` with the same callback: the next update averages into the copied weights
+    swa.n_averaged = torch.tensor(3)
+    swa._latest_update_epoch = 2
+    swa.setup(mock.Mock(), model, "fit")
+    for p_swa, p_model in zip(swa._average_model.parameters(), model.parameters()):
+        assert p_swa is not p_model
+        torch.testing.assert_close(p_swa, p_model)
+
+
+def test_swa_never_started(tmp_path):
+    """Test that the averaged weights are not transferred if SWA never updated them."""
+
+    class CountingSWA(StochasticWeightAveraging):
+        transfer_weights_calls = 0
+
+        def transfer_weights(self, *args, **kwargs):
+            self.transfer_weights_calls += 1
+            return super().transfer_weights(*args, **kwargs)
+
+    model = SwaTestModel(batchnorm=True)
+    swa = CountingSWA(swa_epoch_start=5, swa_lrs=0.1)
+    trainer = Trainer(
+        default_root_dir=tmp_path,
+        max_epochs=2,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        callbacks=swa,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        enable_checkpointing=False,
+        logger=False,
+    )
+    trainer.fit(model)
+    assert swa._latest_update_epoch == -1
+    assert swa.transfer_weights_calls == 0
+    assert swa.momenta == {}
+    assert all(torch.isfinite(p).all() for p in model.parameters())
+
+
+def test_swa_reset_batch_norm_without_fit():
+    model = SwaTestModel(batchnorm=True)
+    bn = model.layer[1]
+    bn.running_mean.fill_(2.0)
+    bn.running_var.fill_(3.0)
+    swa = StochasticWeightAveraging(swa_lrs=0.1)
+
+    swa.reset_batch_norm_and_save_state(model)
+    assert torch.equal(bn.running_mean, torch.zeros_like(bn.running_mean))
+    assert torch.equal(bn.running_var, torch.ones_like(bn.running_var))
+    assert swa.momenta == {bn: 0.1}
+    assert bn.momentum is None
+
+    # the cached layers are not reused for a different module
+    other = SwaTestModel(batchnorm=True)
+    swa.reset_batch_norm_and_save_state(other)
+    assert list(swa.momenta) == [other.layer[1]]
+    swa.reset_momenta()
+    assert other.layer[1].momentum == 0.1
 
 
 def test_swa_deepcopy(tmp_path):
@@ -245,6 +377,10 @@ def test_swa_deepcopy(tmp_path):
             assert self._average_model.train_dataloader is not pl_module.train_dataloader
             assert self._average_model.train_dataloader.__self__ == self._average_model
             assert self._average_model._trainer is None
+            for p_avg, p in zip(self._average_model.parameters(), pl_module.parameters()):
+                assert p_avg is not p
+                assert p_avg.data_ptr() != p.data_ptr()
+                assert p_avg.shape == p.shape
             self.setup_called = True
 
     model = BoringModel()
@@ -291,6 +427,47 @@ def test_swa_multiple_lrs(tmp_path):
     assert model.on_train_epoch_start_called
 
 
+def test_swa_param_group_added_before_start(tmp_path):
+    """Test that a float `swa_lrs` also applies to param groups added after the fit started, e.g. by a finetuning
+    callback."""
+
+    class TestModel(BoringModel):
+        def __init__(self):
+            super().__init__()
+            self.layer1 = torch.nn.Linear(32, 32)
+            self.layer2 = torch.nn.Linear(32, 2)
+
+        def forward(self, x):
+            return self.layer2(self.layer1(x))
+
+        def configure_optimizers(self):
+            return torch.optim.SGD(self.layer1.parameters(), lr=0.1)
+
+        def on_train_epoch_start(self):
+            optimizer = self.trainer.optimizers[0]
+            if self.current_epoch == 0:
+                optimizer.add_param_group({"params": self.layer2.parameters(), "lr": 0.2})
+            elif self.current_epoch == 1:
+                assert [pg["swa_lr"] for pg in optimizer.param_groups] == [0.05, 0.05]
+                assert [pg["initial_lr"] for pg in optimizer.param_groups] == [0.05, 0.05]
+
+    model = TestModel()
+    swa_callback = StochasticWeightAveraging(swa_lrs=0.05, swa_epoch_start=2)
+    trainer = Trainer(
+        default_root_dir=tmp_path,
+        callbacks=swa_callback,
+        max_epochs=2,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        logger=False,
+        enable_checkpointing=False,
+    )
+    trainer.fit(model)
+    assert swa_callback._swa_lrs == [0.05, 0.05]
+
+
 def _swa_resume_training_from_checkpoint(tmp_path, model, resume_model, ddp=False):
     swa_start = 3
     trainer_kwargs = {
@@ -16,6 +16,7 @@ from unittest import mock
 from unittest.mock import MagicMock, Mock
 
 import pytest
+from lightning_utilities.test.warning import no_warning_call
 
 from lightning.pytorch import Trainer
 from lightning.pytorch.demos.boring_classes import BoringModel
@@ -23,6 +24,7 @@ from lightning.pytorch.loggers.mlflow import (
     _MLFLOW_AVAILABLE,
     MLFlowLogger,
     _get_resolve_tags,
+    _sanitize_metric_name,
 )
 
 
@@ -225,12 +227,19 @@ def test_mlflow_experiment_id_retrieved_once(_, mlflow_mock, tmp_path):
 @mock.patch("lightning.pytorch.loggers.mlflow._get_resolve_tags", Mock())
 def test_mlflow_logger_with_unexpected_characters(mlflow_mock, tmp_path):
     """Test that the logger raises warning with special characters not accepted by MLFlow."""
+    _sanitize_metric_name.cache_clear()
     logger = MLFlowLogger("test", save_dir=str(tmp_path))
     metrics = {"[some_metric]": 10}
 
     with pytest.warns(RuntimeWarning, match="special characters in metric name"):
         logger.log_metrics(metrics)
 
+    # the sanitized name is cached, so the warning is only raised the first time a metric name is seen
+    assert _sanitize_metric_name.cache_info().currsize == 1
+    with no_warning_call(RuntimeWarning, match="special characters in metric name"):
+        logger.log_metrics(metrics)
+    assert mlflow_mock.entities.Metric.call_args.kwargs["key"] == "some_metric"
+
 
 @mock.patch("lightning.pytorch.loggers.mlflow._get_resolve_tags", Mock())
 def test_mlflow_logger_experiment_calls(mlflow_mock, tmp_path):
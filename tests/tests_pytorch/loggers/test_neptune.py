@@ -209,6 +209,11 @@ def test_log_metrics(neptune_mock):
         run_instance_mock.__getitem__.assert_any_call(metrics_bar_key)
         run_attr_mock.append.assert_has_calls([call(42, step=None), call(555, step=None)])
 
+        # empty metrics are skipped without touching the run
+        run_instance_mock.reset_mock()
+        logger.log_metrics({})
+        run_instance_mock.__getitem__.assert_not_called()
+
 
 def test_log_model_summary(neptune_mock):
     model = BoringModel()
@@ -171,6 +171,34 @@ def test_ddp_configure_ddp(mps_count_0):
     assert isinstance(trainer.model, LightningModule)
 
 
+@pytest.mark.parametrize("already_enqueued", [False, True])
+def test_ddp_post_backward_static_graph_manual_optimization(already_enqueued):
+    """Test that the first static-graph backward with manual optimization flushes the DDP buckets exactly once."""
+    model = BoringModel()
+    model.automatic_optimization = False
+    strategy = DDPStrategy()
+    strategy._lightning_module = model
+    ddp_model = mock.MagicMock(spec=DistributedDataParallel)
+    ddp_model.static_graph = True
+    ddp_model.require_backward_grad_sync = True
+    ddp_model.reducer = mock.Mock()
+    if already_enqueued:
+        ddp_model._static_graph_delay_allreduce_enqueued = True
+    strategy.model = ddp_model
+
+    strategy.post_backward(torch.tensor(0.0))
+    strategy.post_backward(torch.tensor(0.0))
+    assert ddp_model.reducer._delay_all_reduce.call_count == (0 if already_enqueued else 1)
+    assert ddp_model._static_graph_delay_allreduce_enqueued
+
+    # automatic optimization relies on DDP's own flush
+    model.automatic_optimization = True
+    strategy._static_graph_delay_done = False
+    ddp_model.reducer.reset_mock()
+    strategy.post_backward(torch.tensor(0.0))
+    ddp_model.reducer._delay_all_reduce.assert_not_called()
+
+
 @RunIf(min_cuda_gpus=1)
 @pytest.mark.parametrize("trainer_fn", [TrainerFn.VALIDATING, TrainerFn.TESTING, TrainerFn.PREDICTING])
 def test_ddp_dont_configure_sync_batchnorm(trainer_fn):